@@ -26,6 +26,7 @@ Utils
    :toctree: generated/
 
     cache
+    cache_parsed
     mix_labels
     one_hot_encode
     CatDataset
@@ -33,5 +34,10 @@ Utils
 from opendataval.dataloader import datasets
 from opendataval.dataloader.fetcher import DataFetcher
 from opendataval.dataloader.noisify import NoiseFunc, add_gauss_noise, mix_labels
-from opendataval.dataloader.register import Register, cache, one_hot_encode
+from opendataval.dataloader.register import (
+    Register,
+    cache,
+    cache_parsed,
+    one_hot_encode,
+)
 from opendataval.dataloader.util import CatDataset
@@ -4,7 +4,12 @@ from pathlib import Path
 import pandas as pd
 import requests
 
-from opendataval.dataloader.register import Register, _from_pandas, cache
+from opendataval.dataloader.register import (
+    Register,
+    _from_pandas,
+    _request_session,
+    cache,
+)
 
 CHALLENGE_URL = "https://opendataval.yongchanstat.com/challenge"
 """Backend URL for opendataval to get drive ids to the challenge data set."""
@@ -19,7 +24,7 @@ def _dataset_url(drive_id: str):
 
 def _challenge_ids(challenge: str) -> list[dict[str, str]]:
     """Get challenge ids from the opendataval backend."""
-    return requests.get(f"{CHALLENGE_URL}/{challenge}").json()
+    return _request_session().get(f"{CHALLENGE_URL}/{challenge}").json()
 
 
 def download_drive(name: str, drive_id: str, cache_dir: Path, force_download: bool):
@@ -1,13 +1,18 @@
 """Default data sets."""
-import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 import pandas as pd
-import sklearn.datasets as ds
-from sklearn.datasets import fetch_openml
+from scipy.special import expit
 from sklearn.preprocessing import StandardScaler, minmax_scale
 
-from opendataval.dataloader.register import Register, cache
+from opendataval.dataloader.register import (
+    Register,
+    cache,
+    cache_parsed,
+    one_hot_encode,
+)
 
 
 def load_openml(data_id: int, is_classification=True):
@@ -15,6 +20,8 @@ def load_openml(data_id: int, is_classification=True):
 
     A help function to load openml datasets with OpenML ID.
     """
+    from sklearn.datasets import fetch_openml
+
     dataset = fetch_openml(data_id=data_id, as_frame=False)
     category_list = list(dataset["categories"].keys())
     if len(category_list) > 0:
@@ -42,12 +49,14 @@ def gaussian_classifier(n: int = 10000, input_dim: int = 10):
 
     Artificially generated gaussian noise data set.
     """
-    covar = np.random.normal(size=(n, input_dim))
+    # Seeded from the global state, so np.random.seed still reproduces the data set
+    rng = np.random.default_rng(np.random.randint(2**32, dtype=np.uint32))
+    covar = rng.standard_normal((n, input_dim), dtype=np.float32)
 
-    beta_true = np.random.normal(size=input_dim).reshape(input_dim, 1)
-    p_true = np.exp(covar.dot(beta_true)) / (1.0 + np.exp(covar.dot(beta_true)))
+    beta_true = rng.standard_normal((input_dim, 1), dtype=np.float32)
+    p_true = expit(covar @ beta_true)  # Numerically stable sigmoid
 
-    labels = np.random.binomial(n=1, p=p_true).reshape(-1)
+    labels = rng.binomial(n=1, p=p_true.ravel()).astype(np.int8)
 
     return covar, labels
 
@@ -71,17 +80,27 @@ def download_adult(cache_dir: str, force_download: bool = False):
         Data Valuation using Reinforcement Learning,
         arXiv.org, 2019. Available: https://arxiv.org/abs/1909.11671.
     """
-    uci_url = "https://archive.ics.uci.edu/ml/machine-learning-databases/adult"
-    train_path = cache(uci_url + "/adult.data", cache_dir, "train.csv", force_download)
-    test_path = cache(uci_url + "/adult.test", cache_dir, "test.csv", force_download)
+    builder = partial(_parse_adult, cache_dir, force_download)
+    return cache_parsed(cache_dir, "adult", builder, force_download)
 
-    data_train = pd.read_csv(train_path, header=None)
-    data_test = pd.read_csv(test_path, skiprows=1, header=None)
 
-    df = pd.concat((data_train, data_test), axis=0)
+def _parse_adult(cache_dir: str, force_download: bool):
+    """Download and parse the Adult Income data set into covariates and labels."""
+    uci_url = "https://archive.ics.uci.edu/ml/machine-learning-databases/adult"
+    download = partial(cache, cache_dir=cache_dir, force_download=force_download)
+
+    # Downloads are I/O bound, fetches both files concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        train_future = executor.submit(
+            download, uci_url + "/adult.data", file_name="train.csv"
+        )
+        test_future = executor.submit(
+            download, uci_url + "/adult.test", file_name="test.csv"
+        )
+        train_path, test_path = train_future.result(), test_future.result()
 
     # Column names
-    df.columns = [
+    columns = [
         "Age",
         "WorkClass",
         "fnlwgt",
@@ -98,21 +117,27 @@ def download_adult(cache_dir: str, force_download: bool = False):
         "NativeCountry",
         "Income",
     ]
-
-    # Creates binary labels
-    df["Income"] = df["Income"].map(
-        {" <=50K": 0, " >50K": 1, " <=50K.": 0, " >50K.": 1}
-    )
-
-    # Changes string to float
-    df.Age = df.Age.astype(float)
-    df.fnlwgt = df.fnlwgt.astype(float)
-    df.EducationNum = df.EducationNum.astype(float)
-    df.EducationNum = df.EducationNum.astype(float)
-    df.CapitalGain = df.CapitalGain.astype(float)
-    df.CapitalLoss = df.CapitalLoss.astype(float)
-
-    # One-hot encoding
+    # Parses numeric columns as floats once instead of casting after the fact
+    numeric_dtypes = {
+        "Age": np.float32,
+        "fnlwgt": np.float32,
+        "EducationNum": np.float32,
+        "CapitalGain": np.float32,
+        "CapitalLoss": np.float32,
+        "HoursPerWeek": np.float32,
+    }
+    read_kwargs = {"names": columns, "dtype": numeric_dtypes, "engine": "c"}
+
+    data_train = pd.read_csv(train_path, header=None, **read_kwargs)
+    data_test = pd.read_csv(test_path, skiprows=1, header=None, **read_kwargs)
+
+    df = pd.concat([data_train, data_test], axis=0, copy=False, ignore_index=True)
+
+    # Creates binary labels, test set labels have a trailing period
+    df["Income"] = df["Income"].str.strip().str.rstrip(".").eq(">50K").astype(np.int8)
+
+    # One-hot encoding, float32 dummies avoid casting a float64 block afterwards
+    labels = df.pop("Income").to_numpy(np.int8)
     df = pd.get_dummies(
         df,
         columns=[
@@ -125,34 +150,35 @@ def download_adult(cache_dir: str, force_download: bool = False):
             "Gender",
             "NativeCountry",
         ],
+        dtype=np.float32,
     )
 
-    # Sets label name as Y
-    df = df.rename(columns={"Income": "Income"})
-    df["Income"] = df["Income"].astype(int)
-
-    # Resets index
-    df = df.reset_index()
-    df = df.drop(columns=["index"])
-    return df.drop("Income", axis=1).values, df["Income"].values
+    return df.to_numpy(np.float32), labels
 
 
 @Register("iris", one_hot=True)
 def download_iris():
     """Categorical data set registered as ``"iris"``."""
-    return ds.load_iris(return_X_y=True)
+    from sklearn.datasets import load_iris
+
+    return load_iris(return_X_y=True)
 
 
 @Register("digits", one_hot=True)
 def download_digits():
     """Categorical data set registered as ``"digits"``."""
-    return ds.load_digits(return_X_y=True)
+    from sklearn.datasets import load_digits
 
+    return load_digits(return_X_y=True)
 
-@Register("breast_cancer", True).add_covar_transform(minmax_scale)
+
+# Scales in place, covariates are float64 and cast to a fresh float32 array on load
+@Register("breast_cancer", True).add_covar_transform(partial(minmax_scale, copy=False))
 def download_breast_cancer():
     """Categorical data set registered as ``"breast_cancer"``."""
-    return ds.load_breast_cancer(return_X_y=True)
+    from sklearn.datasets import load_breast_cancer
+
+    return load_breast_cancer(return_X_y=True)
 
 
 @Register("election", one_hot=True, cacheable=True)
@@ -167,13 +193,15 @@ def download_election(cache_dir: str, force_download: bool):
         U.S. President 1976-2020.
         Harvard Dataverse, 2017. doi: 10.7910/DVN/42MVDX.
     """
-    if not os.path.isdir(cache_dir):
-        os.makedirs(cache_dir)
+    builder = partial(_parse_election, cache_dir, force_download)
+    return cache_parsed(cache_dir, "election", builder, force_download)
 
+
+def _parse_election(cache_dir: str, force_download: bool):
+    """Download and parse the presidential election data set."""
     url = "https://dataverse.harvard.edu/api/access/datafile/4299753?gbrecs=false"
     filepath = cache(url, cache_dir, "1976-2020-president.tab", force_download)
 
-    df = pd.read_csv(filepath, delimiter="\t")
     drop_col = [
         "notes",
         "party_detailed",
@@ -184,11 +212,19 @@ def download_election(cache_dir: str, force_download: bool):
         "office",
     ]
 
-    df = df.drop(drop_col, axis=1)
-    df = pd.get_dummies(df, columns=["state"])
+    # Skips the dropped columns while parsing, categorical columns are parsed as codes
+    df = pd.read_csv(
+        filepath,
+        delimiter="\t",
+        usecols=lambda col: col not in drop_col,
+        dtype={"state": "category", "party_simplified": "category"},
+        engine="c",
+    )
 
-    covar = df.drop("party_simplified", axis=1).astype("float").values
-    labels = df["party_simplified"].astype("category").cat.codes.values
+    # One-hot encodes states from their (alphabetical) category codes
+    states = one_hot_encode(df.pop("state").cat.codes.to_numpy())
+    labels = df.pop("party_simplified").cat.codes.to_numpy(np.int8)
+    covar = np.hstack((df.to_numpy(np.float32), states))
 
     return covar, labels
 
@@ -204,13 +240,17 @@ Register("gaussian_classifier_high_dim", one_hot=True).from_covar_label_func(
 @Register("diabetes")
 def download_diabetes():
     """Regression data set registered as ``"diabetes"``."""
-    return ds.load_diabetes(return_X_y=True)
+    from sklearn.datasets import load_diabetes
+
+    return load_diabetes(return_X_y=True)
 
 
 @Register("linnerud")
 def download_linnerud():
     """Regression data set registered as ``"linnerud"``."""
-    return ds.load_linnerud(return_X_y=True)
+    from sklearn.datasets import load_linnerud
+
+    return load_linnerud(return_X_y=True)
 
 
 # OpenML Classification Datasets
@@ -112,12 +112,14 @@ def ResnetEmbeding(
         # We will register a hook to extract the ouput of avgpool layers.
         labels_list = []
 
-        with torch.no_grad():  # Passes through model, and our hook extracts outputs
+        # Passes through model, and our hook extracts outputs. Embeddings are written
+        # to disk and loaded back as regular tensors, so inference mode is safe
+        with torch.inference_mode():
             for batch_num, (img, labels) in tqdm.tqdm(
                 enumerate(DataLoader(data, batch_size, pin_memory=True, num_workers=4))
             ):
-                img = img.to(device)
-                embedding = embedder(img).detach().cpu()
+                img = img.to(device, non_blocking=True)
+                embedding = embedder(img).cpu()
                 labels_list.extend(labels)
 
                 folder_dataset.write(batch_num, embedding)
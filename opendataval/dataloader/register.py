@@ -1,4 +1,5 @@
 import os
+import shutil
 import warnings
 from functools import lru_cache, partial
 from pathlib import Path
@@ -10,6 +11,9 @@ import requests
 import tqdm
 from torch.utils.data import Dataset
 
+_DEFAULT_FLOAT = np.float32
+"""Float dtype loaded double precision covariates are cast to."""
+
 DatasetFunc = Callable[..., Union[Dataset, np.ndarray, tuple[np.ndarray, np.ndarray]]]
 Self = TypeVar("Self", bound="Register")
 
@@ -63,14 +67,65 @@ def cache(
 
         with session.get(url, stream=True, timeout=60) as r:
             r.raise_for_status()
+            r.raw.decode_content = True  # Decompresses gzip/deflate encoded bodies
+            # Content-length is the encoded size, unknown once the body is decoded
+            encoded = "content-encoding" in r.headers
+            total = None if encoded else int(r.headers.get("content-length", 0)) or None
 
-            with open(filepath, "wb") as f:
-                for chunk in tqdm.tqdm(r.iter_content(chunk_size=8192), "Downloading:"):
-                    f.write(chunk)
+            with open(filepath, "wb") as f, tqdm.tqdm.wrapattr(
+                r.raw, "read", total=total, desc="Downloading:"
+            ) as raw:
+                shutil.copyfileobj(raw, f, length=1 << 20)  # 1 MiB buffer
 
     return filepath
 
 
+def cache_parsed(
+    cache_dir: Path,
+    name: str,
+    builder: Callable[[], tuple[np.ndarray, np.ndarray]],
+    force_download: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build covariates and labels once and memory-map the saved arrays thereafter.
+
+    Parsing raw files (csv, etc.) can be slow, so the parsed arrays are saved as
+    ``.npy`` files alongside the downloaded files and loaded with ``mmap_mode="r"``
+    on subsequent calls. The returned arrays are read-only.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory to cache the parsed arrays
+    name : str
+        Name prefix of the saved array files
+    builder : Callable[[], tuple[np.ndarray, np.ndarray]]
+        Callable that downloads and parses the data set into covariates and labels
+    force_download : bool, optional
+        Forces the data set to be built again regardless if it is cached,
+        by default False
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Covariates and labels of the data set
+    """
+    cache_dir = Path(cache_dir)
+    covar_path = cache_dir / f"{name}_covar.npy"
+    label_path = cache_dir / f"{name}_labels.npy"
+
+    if force_download or not (covar_path.exists() and label_path.exists()):
+        covar, labels = builder()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        for path, array in ((covar_path, covar), (label_path, labels)):
+            tmp_path = path.with_suffix(".tmp")  # Avoids reading partial writes
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(array))
+            tmp_path.replace(path)
+
+    return np.load(covar_path, mmap_mode="r"), np.load(label_path, mmap_mode="r")
+
+
 def one_hot_encode(data: np.ndarray) -> np.ndarray:
     """One hot encodes a numpy array.
 
@@ -79,11 +134,16 @@ def one_hot_encode(data: np.ndarray) -> np.ndarray:
     ValueError
         When the input array is not of shape (N,), (N,1), (N,1,1)...
     """
-    if not isinstance(data,np.ndarray):
-        data=np.array(data)
+    if not isinstance(data, np.ndarray):
+        data = np.array(data)
     data = data.reshape(len(data))  # Reduces shape to (N,) array
-    num_values = np.max(data) + 1
-    return np.eye(num_values)[data]
+    num_values = int(data.max()) + 1
+
+    # Scatters directly into the output, avoids materializing a (K, K) identity.
+    # The 2D (row, col) index keeps negative codes within their own row.
+    out = np.zeros((len(data), num_values), dtype=np.float32)
+    out[np.arange(len(data)), data] = 1.0
+    return out
 
 
 def _read_csv(filepath: str, label_columns: Union[str, list]):
@@ -95,14 +155,47 @@ def _from_pandas(df: pd.DataFrame, labels: Union[str, list]):
     """Create data set from pandas dataframe, nested functions for api consistency."""
     if all(isinstance(col, int) for col in labels):
         labels = df.columns[labels]
-    return df.drop(labels, axis=1).values, df[labels].values
+
+    # Selects the feature columns directly rather than copying the frame with drop
+    label_set = {labels} if isinstance(labels, str) else set(labels)
+    feature_cols = [col for col in df.columns if col not in label_set]
+    return df[feature_cols].to_numpy(copy=False), df[labels].to_numpy(copy=False)
 
 
 def _from_numpy(array: np.ndarray, label_columns: Union[int, list[int]]):
     """Create data set from numpy array, nested functions for api consistency."""
     if isinstance(label_columns, int):
         label_columns = [label_columns]
-    return np.delete(array, label_columns, axis=1), array[:, label_columns]
+
+    num_columns = array.shape[1]
+    if any(not -num_columns <= col < num_columns for col in label_columns):
+        raise IndexError(f"{label_columns=} out of bounds for {num_columns} columns")
+    label_columns = [col % num_columns for col in label_columns]  # Handles negatives
+    k = len(label_columns)
+
+    # Labels are typically the trailing columns, slicing returns views without copies
+    if label_columns == list(range(num_columns - k, num_columns)):
+        return array[:, : num_columns - k], array[:, num_columns - k :]
+
+    mask = np.ones(num_columns, dtype=bool)
+    mask[label_columns] = False
+    return array[:, mask], array[:, label_columns]
+
+
+def _read_only(data: Union[Dataset, np.ndarray]) -> Union[Dataset, np.ndarray]:
+    """Return a read-only view of arrays, so memoized arrays can't be modified."""
+    if not isinstance(data, np.ndarray):
+        return data
+    view = data.view()
+    view.flags.writeable = False
+    return view
+
+
+@lru_cache(maxsize=8)
+def _load_memoized(dataset: "Register", cache_dir: str):
+    """Memoize downloaded data sets, avoids parsing the same files repeatedly."""
+    covar, label = dataset._load_raw(cache_dir=cache_dir, force_download=False)
+    return _read_only(covar), _read_only(label)
 
 
 class Register:
@@ -130,6 +223,18 @@ class Register:
         be unique. If there are any duplicates, warns user.
     """
 
+    __slots__ = (
+        "dataset_name",
+        "one_hot",
+        "presplit",
+        "covar_transform",
+        "label_transform",
+        "cacheable",
+        "covar_label_func",
+        "cov_func",
+        "label_func",
+    )
+
     CACHE_DIR = "data_files"
     """Default directory to cache downloads to."""
 
@@ -158,6 +263,10 @@ class Register:
 
         self.cacheable = cacheable
 
+        self.covar_label_func = None
+        self.cov_func = None
+        self.label_func = None
+
         Register.Datasets[dataset_name] = self
 
     def from_csv(self, filepath: str, label_columns: Union[str, list]):
@@ -214,6 +323,12 @@ class Register:
         self.label_transform = transform
         return self
 
+    def _load_raw(self, **dataset_kwargs) -> tuple[Dataset, np.ndarray]:
+        """Retrieve covariates and labels from the registered callables."""
+        if self.covar_label_func is not None:
+            return self.covar_label_func(**dataset_kwargs)
+        return self.cov_func(**dataset_kwargs), self.label_func(**dataset_kwargs)
+
     def load_data(
         self, cache_dir: Optional[str] = None, force_download: bool = False
     ) -> tuple[Dataset, np.ndarray]:
@@ -233,28 +348,38 @@ class Register:
         Returns
         -------
         (np.ndarray | Dataset, np.ndarray)
-            Transformed covariates and labels of the data set
+            Transformed covariates and labels of the data set. Downloaded data sets
+            are memoized and their arrays are read-only, call ``.copy()`` before
+            modifying them in place.
         """
-        dataset_kwargs = {}
-
         if self.cacheable:
             cache_dir = Path(cache_dir if cache_dir is not None else Register.CACHE_DIR)
             cache_dir.mkdir(parents=True, exist_ok=True)
-
-            full_path = cache_dir / self.dataset_name
-            dataset_kwargs["cache_dir"] = str(full_path)
-            dataset_kwargs["force_download"] = force_download
-
-        if hasattr(self, "covar_label_func"):
-            covar, label = self.covar_label_func(**dataset_kwargs)
+            full_path = str(cache_dir / self.dataset_name)
+
+            if force_download:
+                _load_memoized.cache_clear()  # Drops stale memoized data sets
+            if self.presplit or force_download:  # Presplit data may be an iterator
+                covar, label = self._load_raw(
+                    cache_dir=full_path, force_download=force_download
+                )
+            else:
+                covar, label = _load_memoized(self, full_path)
         else:
-            covar = self.cov_func(**dataset_kwargs)
-            label = self.label_func(**dataset_kwargs)
+            covar, label = self._load_raw()
 
         # Wraps response in tuple in case data is not presplit
         covar_tup = covar if self.presplit else (covar,)
         label_tup = label if self.presplit else (label,)
 
+        # Double precision is unnecessary for covariates, halves memory bandwidth
+        covar_tup = tuple(
+            cov.astype(_DEFAULT_FLOAT, copy=False)
+            if isinstance(cov, np.ndarray) and cov.dtype == np.float64
+            else cov
+            for cov in covar_tup
+        )
+
         if self.covar_transform:
             if isinstance(covar, Dataset):
                 for cov in covar_tup:
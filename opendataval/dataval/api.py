@@ -42,7 +42,8 @@ class DataEvaluator(ABC, ReprMixin):
     pred_model : Model
         Prediction model to find how much each training datum contributes towards it.
     data_values: np.array
-        Cached data values, used by :py:mod:`opendataval.experiment.exper_methods`
+        Cached data values, used by :py:mod:`opendataval.experiment.exper_methods`.
+        Computed once per call of :py:meth:`DataEvaluator.train`
     """
 
     Evaluators: ClassVar[dict[str, Self]] = {}
@@ -154,6 +155,7 @@ class DataEvaluator(ABC, ReprMixin):
         self : object
             Returns a Data Evaluator.
         """
+        self.__dict__.pop("data_values", None)  # Clears values cached by prior training
         self.setup(fetcher, pred_model, metric)
         self.train_data_values(*args, **kwargs)
 
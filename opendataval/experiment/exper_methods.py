@@ -5,10 +5,12 @@ and :py:meth:`~opendataval.experiment.api.ExperimentMediator.plot` evaluate perf
 of one :py:class:`~opendataval.dataval.api.DataEvaluator` at a time.
 """
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import numpy as np
 import pandas as pd
+import torch
+from joblib import Parallel, delayed, parallel_backend
 from matplotlib.axes import Axes
 from mpl_toolkits.axes_grid1.axes_divider import make_axes_locatable
 from torch.utils.data import Subset
@@ -18,7 +20,32 @@ from opendataval.dataval import DataEvaluator
 from opendataval.experiment.util import f1_score, oned_twonn_clustering
 from opendataval.metrics import Metrics
 from opendataval.model import Model
-from opendataval.util import get_name
+from opendataval.util import _draw_seeds, _seeded_fit_predict, get_name
+
+
+def _subset(data: Any, indices: np.ndarray) -> Any:
+    """Gather the subset once, a :py:class:`Subset` indexes per sample every epoch."""
+    if isinstance(data, torch.Tensor):
+        return data[torch.as_tensor(indices, dtype=torch.long, device=data.device)]
+    if isinstance(data, np.ndarray):
+        return data[indices]
+    return Subset(data, indices)
+
+
+def _fit_predict(
+    reset_model: Callable[[], Model],
+    x_train: Any,
+    y_train: Any,
+    x_test: Any,
+    indices: np.ndarray,
+    train_kwargs: dict[str, Any],
+    seed: int,
+) -> torch.Tensor:
+    """Fit a reset model on the subset of training data, predicts test data."""
+    x_subset, y_subset = _subset(x_train, indices), _subset(y_train, indices)
+    return _seeded_fit_predict(
+        reset_model, x_subset, y_subset, x_test, train_kwargs, seed
+    )
 
 
 def noisy_detection(
@@ -71,6 +98,8 @@ def remove_high_low(
     plot: Optional[Axes] = None,
     metric: Metrics = Metrics.ACCURACY,
     train_kwargs: Optional[dict[str, Any]] = None,
+    n_jobs: int = 1,
+    warm_start: bool = False,
 ) -> dict[str, list[float]]:
     """Evaluate performance after removing high/low points determined by data valuator.
 
@@ -103,6 +132,17 @@ def remove_high_low(
         metrics or a Callable[[Tensor, Tensor], float], by default accuracy
     train_kwargs : dict[str, Any], optional
         Training key word arguments for training the pred_model, by default None
+    n_jobs : int, optional
+        Number of processes retraining the models of each bin in parallel, ``-1``
+        uses all processors, by default 1. Every bin is seeded from torch's random
+        state, so results don't depend on ``n_jobs``
+    warm_start : bool, optional
+        Whether to continue training the previous bin's models instead of retraining
+        from the initial state, as consecutive bins share most data points. Bins are
+        then trained sequentially, ``n_jobs`` is ignored, by default False. The
+        shrinking coalitions keep what the models learned from the points already
+        removed, so the curves no longer measure the effect of removing them.
+        sk-learn wrapped models refit from scratch, so for them this is a cold start
 
     Returns
     -------
@@ -124,44 +164,61 @@ def remove_high_low(
 
     data_values = evaluator.data_values
     model = model if model is not None else evaluator.pred_model
-    curr_model = model.clone()
+    reset_model = model.snapshot()  # Resets to initial state for every retrain
 
     num_points = len(x_train)
     num_period = max(round(num_points * percentile), 5)  # Add at least 5/bin
     num_bins = int(num_points // num_period)
-    sorted_value_list = np.argsort(data_values)
+    # int32 indices halve the bytes sent to each worker, slices are views
+    sorted_value_list = np.argsort(data_values).astype(np.int32)
+    bin_starts = np.arange(0, num_points, num_period, dtype=np.int32)
 
     valuable_list, unvaluable_list = [], []
     train_kwargs = train_kwargs if train_kwargs is not None else {}
-
-    for bin_index in range(0, num_points, num_period):
-        # Removing least valuable samples first
-        most_valuable_indices = sorted_value_list[bin_index:]
-
-        # Fitting on valuable subset
-        valuable_model = curr_model.clone()
-        valuable_model.fit(
-            Subset(x_train, most_valuable_indices),
-            Subset(y_train, most_valuable_indices),
-            **train_kwargs,
-        )
-        y_hat_valid = valuable_model.predict(x_test).to("cpu")
-        valuable_score = metric(y_test, y_hat_valid)
-        valuable_list.append(valuable_score)
-
-        # Removing most valuable samples first
-        least_valuable_indices = sorted_value_list[: num_points - bin_index]
-
-        # Fitting on unvaluable subset
-        unvaluable_model = curr_model.clone()
-        unvaluable_model.fit(
-            Subset(x_train, least_valuable_indices),
-            Subset(y_train, least_valuable_indices),
-            **train_kwargs,
-        )
-        iy_hat_valid = unvaluable_model.predict(x_test).to("cpu")
-        unvaluable_score = metric(y_test, iy_hat_valid)
-        unvaluable_list.append(unvaluable_score)
+    seeds = _draw_seeds(len(bin_starts))
+
+    if warm_start:  # Each bin continues training the models of the previous bin
+        valuable_model, unvaluable_model = reset_model().clone(), reset_model()
+        predictions = [
+            (
+                _fit_predict(
+                    lambda: valuable_model,
+                    x_train,
+                    y_train,
+                    x_test,
+                    sorted_value_list[bin_index:],
+                    train_kwargs,
+                    seed,
+                ),
+                _fit_predict(
+                    lambda: unvaluable_model,
+                    x_train,
+                    y_train,
+                    x_test,
+                    sorted_value_list[: num_points - bin_index],
+                    train_kwargs,
+                    seed,
+                ),
+            )
+            for bin_index, seed in zip(bin_starts, seeds)
+        ]
+    else:  # Both fits of every bin are independent tasks, returned in order
+        with parallel_backend("loky", inner_max_num_threads=1):
+            predictions = Parallel(n_jobs=n_jobs)(
+                delayed(_fit_predict)(
+                    reset_model, x_train, y_train, x_test, indices, train_kwargs, seed
+                )
+                for bin_index, seed in zip(bin_starts, seeds)
+                for indices in (
+                    sorted_value_list[bin_index:],  # Removing least valuable first
+                    sorted_value_list[: num_points - bin_index],  # Most valuable first
+                )
+            )
+        predictions = zip(predictions[::2], predictions[1::2])
+
+    for y_hat_valid, iy_hat_valid in predictions:
+        valuable_list.append(metric(y_test, y_hat_valid))
+        unvaluable_list.append(metric(y_test, iy_hat_valid))
 
     x_axis = [i / num_bins for i in range(num_bins)]
 
@@ -244,16 +301,14 @@ def discover_corrupted_sample(
     sorted_value_list = np.argsort(data_values, kind="stable")  # Order descending
     noise_rate = len(noisy_train_indices) / len(data_values)
 
-    # Output initialization
-    found_rates = []
+    # Number of noisy indices found after inspecting i lowest data values
+    is_noisy = np.zeros(num_points, dtype=bool)
+    is_noisy[noisy_train_indices] = True
+    num_found = np.concatenate(([0], np.cumsum(is_noisy[sorted_value_list])))
 
-    # For each bin
-    for bin_index in range(0, num_points + num_period, num_period):
-        # from low to high data values
-        found_rates.append(
-            len(np.intersect1d(sorted_value_list[:bin_index], noisy_train_indices))
-            / len(noisy_train_indices)
-        )
+    # For each bin, from low to high data values
+    bin_ends = np.arange(0, num_points + num_period, num_period).clip(max=num_points)
+    found_rates = (num_found[bin_ends] / len(noisy_train_indices)).tolist()
 
     x_axis = [i / num_bins for i in range(len(found_rates))]
     eval_results = {"corrupt_found": found_rates, "axis": x_axis}
@@ -312,6 +367,8 @@ def increasing_bin_removal(
     plot: Optional[Axes] = None,
     metric: Metrics = Metrics.ACCURACY,
     train_kwargs: Optional[dict[str, Any]] = None,
+    n_jobs: int = 1,
+    warm_start: bool = False,
 ) -> dict[str, list[float]]:
     """Evaluate accuracy after removing data points with data values above threshold.
 
@@ -355,6 +412,15 @@ def increasing_bin_removal(
         metrics or a Callable[[Tensor, Tensor], float], by default accuracy
     train_kwargs : dict[str, Any], optional
         Training key word arguments for training the pred_model, by default None
+    n_jobs : int, optional
+        Number of processes retraining the model of each bin in parallel, ``-1``
+        uses all processors, by default 1. Every bin is seeded from torch's random
+        state, so results don't depend on ``n_jobs``
+    warm_start : bool, optional
+        Whether to continue training the previous bin's model instead of retraining
+        from the initial state, as consecutive bins share most data points. Bins are
+        then trained sequentially, ``n_jobs`` is ignored, by default False. sk-learn
+        wrapped models refit from scratch, so for them this is a cold start
 
     Returns
     -------
@@ -371,7 +437,7 @@ def increasing_bin_removal(
     """
     data_values = evaluator.data_values
     model = model if model is not None else evaluator.pred_model
-    curr_model = model.clone()
+    reset_model = model.snapshot()  # Resets to initial state for every retrain
     if isinstance(fetcher, DataFetcher):
         x_train, y_train, *_, x_test, y_test = fetcher.datapoints
     else:
@@ -381,26 +447,47 @@ def increasing_bin_removal(
     num_points = len(data_values)
 
     # Starts with 10 data points
-    bins_indices = [*range(5, num_points - 1, bin_size), num_points - 1]
-    frac_datapoints_explored = [(i + 1) / num_points for i in bins_indices]
+    bins_indices = np.append(np.arange(5, num_points - 1, bin_size), num_points - 1)
+    bins_indices = bins_indices.astype(np.int32)
+    frac_datapoints_explored = ((bins_indices + 1) / num_points).tolist()
 
-    sorted_indices = np.argsort(data_values)
-    x_axis = data_values[sorted_indices[bins_indices]] / np.max(data_values)
+    # int32 indices halve the bytes sent to each worker, slices are views
+    sorted_indices = np.argsort(data_values, kind="stable").astype(np.int32)
+    max_data_value = data_values[sorted_indices[-1]]  # Sorted, so last is the max
+    x_axis = data_values[sorted_indices[bins_indices]] / max_data_value
 
-    perf = []
     train_kwargs = train_kwargs if train_kwargs is not None else {}
-
-    for bin_end in bins_indices:
-        coalition = sorted_indices[:bin_end]
-
-        new_model = curr_model.clone()
-        new_model.fit(
-            Subset(x_train, coalition),
-            Subset(y_train, coalition),
-            **train_kwargs,
-        )
-        y_hat = new_model.predict(x_test)
-        perf.append(metric(y_hat, y_test))
+    seeds = _draw_seeds(len(bins_indices))
+
+    if warm_start:  # Each bin continues training the model of the previous bin
+        warm_model = reset_model()
+        predictions = [
+            _fit_predict(
+                lambda: warm_model,
+                x_train,
+                y_train,
+                x_test,
+                sorted_indices[:bin_end],
+                train_kwargs,
+                seed,
+            )
+            for bin_end, seed in zip(bins_indices, seeds)
+        ]
+    else:  # Bins are retrained independently, results are returned in bin order
+        with parallel_backend("loky", inner_max_num_threads=1):
+            predictions = Parallel(n_jobs=n_jobs)(
+                delayed(_fit_predict)(
+                    reset_model,
+                    x_train,
+                    y_train,
+                    x_test,
+                    sorted_indices[:bin_end],
+                    train_kwargs,
+                    seed,
+                )
+                for bin_end, seed in zip(bins_indices, seeds)
+            )
+    perf = [metric(y_hat, y_test) for y_hat in predictions]
 
     eval_results = {
         "frac_datapoints_explored": frac_datapoints_explored,
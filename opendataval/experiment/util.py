@@ -1,5 +1,4 @@
 import inspect
-from itertools import accumulate
 from typing import Any, Callable, Sequence
 
 import numpy as np
@@ -49,16 +48,19 @@ def oned_twonn_clustering(vals: Sequence[float]) -> tuple[Sequence[int], Sequenc
     sid = np.argsort(vals, kind="stable")
     n = len(vals)
 
-    psums = list(accumulate((vals[sid[i]] for i in range(n)), initial=0.0))
-    psqsums = list(accumulate((vals[sid[i]] ** 2 for i in range(n)), initial=0.0))
+    sorted_vals = np.asarray(vals, dtype=np.float64)[sid]
+    psums = np.concatenate(([0.0], np.cumsum(sorted_vals)))
+    psqsums = np.concatenate(([0.0], np.cumsum(sorted_vals**2)))
 
-    def cost(i: int, j: int):
+    def cost(i: np.ndarray, j: np.ndarray) -> np.ndarray:
         sij = psums[j + 1] - psums[i]
         uij = sij / (j - i + 1)
         return (uij**2) * (j - i + 1) + (psqsums[j + 1] - psqsums[i]) - 2 * uij * sij
 
-    split = min((i for i in range(1, n)), key=lambda i: cost(0, i - 1) + cost(i, n - 1))
-    return sid[range(0, split)], sid[range(split, n)]
+    # Costs of all splits at once, split is the first index of the higher group
+    splits = np.arange(1, n)
+    split = splits[np.argmin(cost(0, splits - 1) + cost(splits, n - 1))]
+    return sid[:split], sid[split:]
 
 
 def f1_score(predicted: Sequence[float], actual: Sequence[float], total: int) -> float:
@@ -1,7 +1,8 @@
 import copy
 import warnings
 from abc import ABC, abstractmethod
-from typing import ClassVar, Optional, TypeVar, Union
+from functools import partial
+from typing import Callable, ClassVar, Optional, TypeVar, Union
 
 import numpy as np
 import torch
@@ -87,6 +88,25 @@ class Model(ABC):
         """
         return copy.deepcopy(self)
 
+    def snapshot(self) -> Callable[[], Self]:
+        """Snapshot the current state of the Model to repeatedly reset to.
+
+        For retraining a model from the same initial conditions many times. Default
+        implementation clones the snapshot on every call.
+
+        Returns
+        -------
+        Callable[[], Self]
+            Returns a Model in the state at the time of the snapshot when called
+        """
+        return self.clone().clone
+
+
+def _load_state(model: "TorchModel", state: dict[str, torch.Tensor]) -> "TorchModel":
+    """Reset the model to a snapshotted state dict, used by ``TorchModel.snapshot``."""
+    model.load_state_dict(state)
+    return model
+
 
 class TorchModel(Model, nn.Module):
     """Torch Models have a device they belong to and shared behavior"""
@@ -95,6 +115,22 @@ class TorchModel(Model, nn.Module):
     def device(self):
         return next(self.parameters()).device
 
+    def snapshot(self) -> Callable[[], Self]:
+        """Snapshot the current state of the Model to repeatedly reset to.
+
+        Clones the Model once and on every call loads the snapshotted state dict into
+        that same clone, avoiding a deep copy of the module per retrain. The returned
+        Model is shared between calls, finish using it before calling again.
+
+        Returns
+        -------
+        Callable[[], Self]
+            Returns a Model in the state at the time of the snapshot when called
+        """
+        model = self.clone()
+        state = {key: val.detach().clone() for key, val in model.state_dict().items()}
+        return partial(_load_state, model, state)
+
 
 class TorchClassMixin(TorchModel):
     """Classifier Mixin for Torch Neural Networks."""
@@ -130,7 +166,13 @@ class TorchClassMixin(TorchModel):
         """
         optimizer = torch.optim.Adam(self.parameters(), lr=lr)
 
-        criterion = F.binary_cross_entropy if self.num_classes == 2 else F.cross_entropy
+        # Models exposing logits fuse the sigmoid into a numerically stable loss
+        if self.num_classes == 2 and hasattr(self, "logits"):
+            criterion, forward = F.binary_cross_entropy_with_logits, self.logits
+        elif self.num_classes == 2:
+            criterion, forward = F.binary_cross_entropy, self.__call__
+        else:
+            criterion, forward = F.cross_entropy, self.__call__
         dataset = CatDataset(x_train, y_train, sample_weight)
 
         self.train()
@@ -144,7 +186,7 @@ class TorchClassMixin(TorchModel):
                 y_batch = y_batch.to(device=self.device)
 
                 optimizer.zero_grad()
-                outputs = self.__call__(x_batch)
+                outputs = forward(x_batch)
 
                 if sample_weight is not None:
                     # F.cross_entropy doesn't support sample_weights
@@ -38,6 +38,21 @@ class LogisticRegression(TorchClassMixin, TorchPredictMixin, TorchGradMixin):
         torch.Tensor
             Output Tensor of logistic regression
         """
-        x = self.linear(x)
+        x = self.logits(x)
         x = F.sigmoid(x)
         return x
+
+    def logits(self, x: torch.Tensor) -> torch.Tensor:
+        """Logits of Logistic Regression, the forward pass before the sigmoid.
+
+        Parameters
+        ----------
+        x : torch.Tensor
+            Input tensor
+
+        Returns
+        -------
+        torch.Tensor
+            Logits of logistic regression
+        """
+        return self.linear(x)
@@ -6,10 +6,10 @@ from functools import update_wrapper
 from itertools import islice
 from typing import Callable, Generic, Optional, TypeVar
 
-import numpy as np
 import pandas as pd
 import torch
 import tqdm
+from joblib import Parallel, delayed, parallel_backend
 from numpy.random import RandomState
 from sklearn.utils import check_random_state
 
@@ -108,8 +108,15 @@ class MeanStdTime:
     """Formats Mean and standard time."""
 
     def __init__(self, input_data: list[float], elapsed_time: float = 0.0):
-        self.mean = np.mean(input_data)
-        self.std = np.std(input_data, ddof=1)
+        # Welford's one pass mean and sample variance, inputs are short lists
+        num, mean, sq_dev = 0, 0.0, 0.0
+        for num, val in enumerate(input_data, start=1):
+            delta = val - mean
+            mean += delta / num
+            sq_dev += delta * (val - mean)
+
+        self.mean = mean
+        self.std = (sq_dev / (num - 1)) ** 0.5 if num > 1 else float("nan")
         self.avg_time = elapsed_time / len(input_data)
 
     def __repr__(self):
@@ -121,28 +128,74 @@ class MeanStdTime:
         )
 
 
+def _draw_seeds(num_seeds: int) -> list[int]:
+    """Draw seeds from torch's generator, set by ``set_random_state``."""
+    return torch.randint(2**31 - 1, (num_seeds,)).tolist()
+
+
+def _seeded_fit_predict(
+    reset_model: Callable, x_train, y_train, x_test, train_kwargs: dict, seed: int
+) -> torch.Tensor:
+    """Fit a reset model seeded with ``seed``, predicts test data.
+
+    Worker processes don't inherit the parent's random state, so every fit is seeded.
+    """
+    with torch.random.fork_rng():  # Leaves the caller's random state untouched
+        torch.manual_seed(seed)
+        new_model = reset_model()
+        new_model.fit(x_train, y_train, **train_kwargs)
+
+        with torch.inference_mode():  # Predictions are only evaluated, skips autograd
+            return new_model.predict(x_test).cpu()
+
+
+def _sweep_predict(
+    reset_model: Callable, x_train, y_train, x_valid, seeds: list[int], kwargs: dict
+) -> tuple[list[torch.Tensor], float]:
+    """Fit a model per seed with the kwargs, returns predictions and elapsed time."""
+    start_time = time.perf_counter()
+    yhat_list = [
+        _seeded_fit_predict(reset_model, x_train, y_train, x_valid, kwargs, seed)
+        for seed in tqdm.tqdm(seeds)
+    ]
+    end_time = time.perf_counter()
+    return yhat_list, end_time - start_time
+
+
 class ParamSweep:
-    def __init__(self, pred_model, evaluator, fetcher, samples: int = 10):
+    def __init__(
+        self, pred_model, evaluator, fetcher, samples: int = 10, n_jobs: int = 1
+    ):
         self.model = pred_model
         self.x_train, self.y_train, self.x_valid, self.y_valid, *_ = fetcher.datapoints
         self.evaluator = evaluator
         self.samples = samples
+        self.n_jobs = n_jobs  # Processes sweeping the kwargs combinations in parallel
 
     def sweep(self, **kwargs_list) -> dict[str, MeanStdTime]:
+        reset_model = self.model.snapshot()  # Same initial state for every fit
+
+        # Each kwargs combination is an independent task, returned in grid order
+        grid = list(self._param_product(**kwargs_list))
+        seeds = _draw_seeds(len(grid) * self.samples)  # Results don't depend on n_jobs
+        with parallel_backend("loky", inner_max_num_threads=1):
+            results = Parallel(n_jobs=self.n_jobs)(
+                delayed(_sweep_predict)(
+                    reset_model,
+                    self.x_train,
+                    self.y_train,
+                    self.x_valid,
+                    seeds[i * self.samples : (i + 1) * self.samples],
+                    kwargs,
+                )
+                for i, kwargs in enumerate(grid)
+            )
+
+        # Evaluates in this process, the evaluator doesn't have to be picklable
         self.result = {}
-        for kwargs in self._param_product(**kwargs_list):
-            perf_list = []
-            start_time = time.perf_counter()
-
-            for _ in tqdm.trange(self.samples):
-                curr_model = self.model.clone()
-                curr_model.fit(self.x_train, self.y_train, **kwargs)
-                yhat = curr_model.predict(self.x_valid).cpu()
-                perf = self.evaluator(yhat, self.y_valid)
-                perf_list.append(perf)
-
-            end_time = time.perf_counter()
-            self.result[str(kwargs)] = MeanStdTime(perf_list, end_time - start_time)
+        for kwargs, (yhat_list, elapsed_time) in zip(grid, results):
+            perf_list = [self.evaluator(yhat, self.y_valid) for yhat in yhat_list]
+            self.result[str(kwargs)] = MeanStdTime(perf_list, elapsed_time)
         return self.result
 
     @staticmethod
@@ -117,6 +117,18 @@ class TestDataEvaluator(unittest.TestCase):
         self.assertEqual(evaluator.evaluate(evaluator.y_train, self.y_train), 1.0)
         self.assertTrue(evaluator.trained)
 
+    def test_data_values_cache(self):
+        evaluator = DummyDataEvaluator(random_state=self.random_state)
+        data_values = evaluator.train(self.fetcher, self.model).data_values
+        self.assertIs(evaluator.data_values, data_values)
+
+        x_train, y_train, *valid_test = (t.numpy() for t in self.fetcher.datapoints)
+        fetcher = DataFetcher.from_data_splits(
+            x_train[:50], y_train[:50], *valid_test, one_hot=False
+        )
+        evaluator.train(fetcher, self.model)
+        self.assertEqual(len(evaluator.data_values), 50)
+
     def test_input_fetcher(self):
         evaluator = DummyDataEvaluator(random_state=self.random_state)
         evaluator = evaluator.input_fetcher(self.fetcher)
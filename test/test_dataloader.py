@@ -60,13 +60,14 @@ class TestDataFetcher(unittest.TestCase):
         self.assertIsInstance(y_test, torch.Tensor)
 
         train_idx, test_idx = list(range(10)), list(range(11, 20))
-        self.assertTrue(np.array_equal(self.data[0][train_idx], self.fetcher.x_train))
+        covar = self.data[0].astype(np.float32)  # Covariates are loaded as float32
+        self.assertTrue(np.array_equal(covar[train_idx], self.fetcher.x_train))
         self.assertTrue(
             np.array_equal(self.data[1][train_idx], self.fetcher.y_train.argmax(axis=1))
         )
         self.assertEqual(x_valid.shape[0], 0)
         self.assertEqual(y_valid.ndim, 2)
-        self.assertTrue(np.array_equal(self.data[0][test_idx], self.fetcher.x_test))
+        self.assertTrue(np.array_equal(covar[test_idx], self.fetcher.x_test))
         self.assertTrue(
             np.array_equal(self.data[1][test_idx], self.fetcher.y_test.argmax(axis=1))
         )
@@ -106,6 +107,15 @@ class TestDataFetcher(unittest.TestCase):
         self.assertTrue(np.array_equal(self.fetcher.y_train, y_train))
         self.assertTrue(self.fetcher.noisy_train_indices.any())
 
+    def test_seeded_dataset(self):
+        dataset = Register.Datasets["gaussian_classifier"]
+        np.random.seed(10)
+        covar, labels = dataset.load_data()
+        np.random.seed(10)
+        seeded_covar, seeded_labels = dataset.load_data()
+        self.assertTrue(np.array_equal(covar, seeded_covar))
+        self.assertTrue(np.array_equal(labels, seeded_labels))
+
     def test_invalid_dataset(self):
         self.assertRaises(KeyError, DataFetcher, dataset_name="nonexistent")
         Register("dummy3", one_hot=True).from_covar_label_func(
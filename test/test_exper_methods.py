@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -18,7 +19,7 @@ from opendataval.experiment.exper_methods import (
     save_dataval,
 )
 from opendataval.metrics import Metrics
-from opendataval.model import Model
+from opendataval.model import LogisticRegression, Model
 from opendataval.util import get_name, set_random_state
 
 
@@ -131,6 +132,84 @@ class TestExperiment(unittest.TestCase):
             self.assertIn(key, result)
             self.assertEqual(axis_len, len(result[key]), f"len(axis)!=len({key})")
 
+    def trainable_data(self) -> dict[str, torch.Tensor]:
+        """One hot encoded training and testing data for a model that trains."""
+        x_train, y_train, *_, x_test, y_test = self.fetcher.datapoints
+        return {
+            "x_train": x_train,
+            "y_train": torch.eye(2)[y_train.long().flatten()],
+            "x_test": x_test,
+            "y_test": torch.eye(2)[y_test.long().flatten()],
+        }
+
+    def test_parallel_bins(self):
+        kwargs = {
+            "model": LogisticRegression(10, 2),
+            "data": self.trainable_data(),
+            "metric": Metrics.ACCURACY,
+            "train_kwargs": {"epochs": 2, "batch_size": 4},
+        }
+        set_random_state(10)
+        result = remove_high_low(self.data_evaluator, **kwargs)
+        set_random_state(10)
+        parallel_result = remove_high_low(self.data_evaluator, n_jobs=2, **kwargs)
+        self.assertEqual(result, parallel_result)
+
+        set_random_state(10)
+        result = increasing_bin_removal(self.data_evaluator, **kwargs)
+        set_random_state(10)
+        parallel_result = increasing_bin_removal(
+            self.data_evaluator, n_jobs=2, **kwargs
+        )
+        key = f"{get_name(Metrics.ACCURACY)}_at_datavalues"
+        self.assertListEqual(result[key], parallel_result[key])
+
+    def test_warm_start(self):
+        model = LogisticRegression(10, 2)
+        initial = model.linear.weight.detach().clone()
+        kwargs = {
+            "model": model,
+            "data": self.trainable_data(),
+            "metric": Metrics.ACCURACY,
+            "train_kwargs": {"epochs": 2, "batch_size": 4},
+        }
+        weights, fit = [], LogisticRegression.fit  # Weights each bin starts from
+
+        def record_fit(self, *args, **kwargs):
+            weights.append(self.linear.weight.detach().clone())
+            return fit(self, *args, **kwargs)
+
+        with patch.object(LogisticRegression, "fit", record_fit):
+            set_random_state(10)
+            warm_result = increasing_bin_removal(
+                self.data_evaluator, warm_start=True, **kwargs
+            )
+            self.assertTrue(torch.equal(weights[0], initial))
+            self.assertFalse(torch.equal(weights[1], initial))  # Carried over
+
+            weights.clear()
+            set_random_state(10)
+            result = increasing_bin_removal(self.data_evaluator, **kwargs)
+            self.assertTrue(all(torch.equal(weight, initial) for weight in weights))
+
+        key = f"{get_name(Metrics.ACCURACY)}_at_datavalues"
+        self.assertNotEqual(result[key], warm_result[key])
+
+    def test_model_snapshot(self):
+        model = LogisticRegression(10, 2)
+        initial = {k: v.clone() for k, v in model.state_dict().items()}
+        reset_model = model.snapshot()
+
+        x_train = torch.tensor(self.fetcher.x_train, dtype=torch.float)
+        y_train = torch.eye(2)[self.fetcher.y_train]  # One hot encoded labels
+        trained = reset_model().fit(x_train, y_train)
+        self.assertFalse(torch.equal(trained.linear.weight, initial["linear.weight"]))
+
+        reset = reset_model()
+        for key, val in reset.state_dict().items():
+            self.assertTrue(torch.equal(val, initial[key]))
+        self.assertIsNot(reset, model)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,10 @@
+import tempfile
 import unittest
 
 import numpy as np
 import pandas as pd
 
-from opendataval.dataloader import Register
+from opendataval.dataloader import Register, cache_parsed, one_hot_encode
 
 
 class TestRegister(unittest.TestCase):
@@ -15,6 +16,15 @@ class TestRegister(unittest.TestCase):
         self.assertTrue(np.array_equal(result[0], df.drop("label", axis=1).values))
         self.assertTrue(np.array_equal(result[1], df["label"].values))
 
+    def test_from_csv(self):
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "label": [0, 1, 1]})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = f"{tmp_dir}/data.csv"
+            df.to_csv(filepath, index=False)
+            result = Register("test_csv").from_csv(filepath, "label").load_data()
+        self.assertTrue(np.array_equal(result[0], df.drop("label", axis=1).values))
+        self.assertTrue(np.array_equal(result[1], df["label"].values))
+
     def test_from_numpy(self):
         reg = Register("test_numpy")
         arr = np.array([[1, 2], [3, 4], [5, 6]])
@@ -23,6 +33,21 @@ class TestRegister(unittest.TestCase):
         self.assertTrue(np.array_equal(result[0], arr[:, [0]]))
         self.assertTrue(np.array_equal(result[1], arr[:, [1]]))
 
+    def test_from_numpy_columns(self):
+        arr = np.arange(12).reshape(3, 4)
+        covar, label = Register("test_numpy_tail").from_numpy(arr, [2, -1]).load_data()
+        self.assertTrue(np.array_equal(covar, arr[:, :2]))
+        self.assertTrue(np.array_equal(label, arr[:, 2:]))
+        self.assertTrue(np.shares_memory(covar, arr))  # Trailing labels are views
+
+        covar, label = Register("test_numpy_mid").from_numpy(arr, [1]).load_data()
+        self.assertTrue(np.array_equal(covar, arr[:, [0, 2, 3]]))
+        self.assertTrue(np.array_equal(label, arr[:, [1]]))
+
+        for col in (4, -5):  # Out of range indices are not wrapped around
+            reg = Register(f"test_numpy_invalid{col}").from_numpy(arr, col)
+            self.assertRaises(IndexError, reg.load_data)
+
     def test_from_data(self):
         reg = Register("test_from_data")
         arr = np.array([[1, 0], [3, 1], [5, 2]])
@@ -64,6 +89,48 @@ class TestRegister(unittest.TestCase):
         self.assertTrue(np.array_equal(result[0], a))
         self.assertTrue(np.array_equal(result[1], b + 1))
 
+    def test_float_covariates(self):
+        reg = Register("test_float_covariates")
+        a, b = np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([0.0, 1.0])
+        reg.from_covar_label_func(lambda: (a, b))
+        covar, label = reg.load_data()
+        self.assertEqual(covar.dtype, np.float32)
+        self.assertEqual(label.dtype, np.float64)  # Labels are not cast
+
+    def test_memoized_load(self):
+        reg = Register("test_memoized", cacheable=True)
+        a, b = np.array([[1, 2], [3, 4], [5, 6]]), np.array([0, 1, 1])
+        calls = []
+
+        def load(cache_dir: str, force_download: bool):
+            calls.append(force_download)
+            return a, b
+
+        reg.from_covar_label_func(load)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            covar, _ = reg.load_data(cache_dir)
+            reg.load_data(cache_dir)
+            self.assertEqual(len(calls), 1)
+            self.assertFalse(covar.flags.writeable)
+            self.assertTrue(a.flags.writeable)  # Source array is untouched
+
+            # Presplit data sets skip the memo without evicting other data sets
+            presplit = Register("test_memoized_presplit", cacheable=True, presplit=True)
+            presplit.from_covar_label_func(lambda cache_dir, force_download: ([a], [b]))
+            presplit.load_data(cache_dir)
+            reg.load_data(cache_dir)
+            self.assertEqual(len(calls), 1)
+
+            reg.load_data(cache_dir, force_download=True)
+            self.assertEqual(calls, [False, True])
+
+    def test_one_hot_encode(self):
+        result = one_hot_encode(np.array([0, 2, 1]))
+        self.assertTrue(np.array_equal(result, np.eye(3)[[0, 2, 1]]))
+        # Negative codes stay within their own row
+        result = one_hot_encode([0, 2, -1, 1])
+        self.assertTrue(np.array_equal(result, np.eye(3)[[0, 2, -1, 1]]))
+
     def test_repeat_register(self):
         n = len(Register.Datasets)
         Register("repeat1")
@@ -71,5 +138,28 @@ class TestRegister(unittest.TestCase):
         self.assertEqual(n + 1, len(Register.Datasets))
 
 
+class TestCacheParsed(unittest.TestCase):
+    def test_cache_parsed(self):
+        a, b = np.array([[1.0, 2.0], [3.0, 4.0]]), np.array([0, 1])
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return a, b
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            covar, labels = cache_parsed(cache_dir, "test", builder)
+            self.assertTrue(np.array_equal(covar, a))
+            self.assertTrue(np.array_equal(labels, b))
+
+            covar, labels = cache_parsed(cache_dir, "test", builder)
+            self.assertEqual(len(calls), 1)  # Loaded from disk on second call
+            self.assertFalse(covar.flags.writeable)
+            self.assertTrue(np.array_equal(covar, a))
+
+            cache_parsed(cache_dir, "test", builder, force_download=True)
+            self.assertEqual(len(calls), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
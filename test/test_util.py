@@ -0,0 +1,35 @@
+import unittest
+
+from sklearn.datasets import make_classification
+
+from opendataval.dataloader import DataFetcher, Register
+from opendataval.metrics import Metrics
+from opendataval.model import LogisticRegression
+from opendataval.util import ParamSweep, set_random_state
+
+Register("test_sweep", one_hot=True).from_covar_label_func(
+    lambda: make_classification(n_samples=100, n_features=5, random_state=10)
+)
+
+
+class TestParamSweep(unittest.TestCase):
+    def setUp(self):
+        self.fetcher = DataFetcher.setup("test_sweep", train_count=60, valid_count=40)
+
+    def sweep(self, n_jobs: int):
+        set_random_state(1)
+        sweep = ParamSweep(
+            LogisticRegression(5, 2), Metrics.ACCURACY, self.fetcher, 3, n_jobs
+        )
+        return sweep.sweep(lr=[0.01, 0.1], epochs=[1])
+
+    def test_parallel_sweep(self):
+        result, parallel_result = self.sweep(n_jobs=1), self.sweep(n_jobs=2)
+        self.assertListEqual(list(result), list(parallel_result))
+        for kwargs, perf in result.items():
+            self.assertEqual(perf.mean, parallel_result[kwargs].mean)
+            self.assertEqual(perf.std, parallel_result[kwargs].std)
+
+
+if __name__ == "__main__":
+    unittest.main()